@@ -2,7 +2,6 @@ package com.frostr.igloo
 
 import android.app.Activity
 import android.app.PendingIntent
-import android.content.Context
 import android.content.Intent
 import android.graphics.Color
 import android.net.Uri
@@ -13,11 +12,12 @@ import android.util.Log
 import android.view.WindowManager
 import com.google.gson.Gson
 import com.google.gson.JsonSyntaxException
-import com.frostr.igloo.bridges.StorageBridge
+import com.frostr.igloo.di.AppContainer
 import com.frostr.igloo.health.IglooHealthManager
 import com.frostr.igloo.services.NIP55HandlerService
 import com.frostr.igloo.util.AuditLogger
 import com.frostr.igloo.util.RequestIdGenerator
+import com.frostr.igloo.util.NIP55IntentParser
 import com.frostr.igloo.debug.NIP55TraceContext
 import com.frostr.igloo.debug.NIP55Checkpoints
 import com.frostr.igloo.debug.NIP55Errors
@@ -49,17 +49,9 @@ class InvisibleNIP55Handler : Activity() {
         @Volatile
         private var activeInstances = mutableSetOf<Int>()
 
-        // Cached StorageBridge to avoid slow EncryptedSharedPreferences init on every request
+        // Whether the shared PermissionChecker (and its StorageBridge) has been warmed up
         @Volatile
-        private var cachedStorageBridge: StorageBridge? = null
-
-        @Synchronized
-        private fun getStorageBridge(context: Context): StorageBridge {
-            return cachedStorageBridge ?: StorageBridge(context.applicationContext).also {
-                cachedStorageBridge = it
-                Log.d(TAG, "Created cached StorageBridge")
-            }
-        }
+        private var permissionCheckerWarmed = false
 
         @Synchronized
         private fun registerInstance(): Int {
@@ -106,10 +98,12 @@ class InvisibleNIP55Handler : Activity() {
         // Register this instance for tracking
         instanceId = registerInstance()
 
-        // Pre-initialize StorageBridge in background if not cached (avoids delay in checkPermission)
-        if (cachedStorageBridge == null) {
+        // Pre-initialize the shared PermissionChecker in background, which builds its
+        // StorageBridge (avoids slow EncryptedSharedPreferences init in checkPermission)
+        if (!permissionCheckerWarmed) {
+            permissionCheckerWarmed = true
             Thread {
-                getStorageBridge(applicationContext)
+                AppContainer.getInstance(applicationContext).permissionChecker
             }.start()
         }
 
@@ -691,7 +685,7 @@ class InvisibleNIP55Handler : Activity() {
     }
 
     private fun validatePublicKey(pubkey: String) {
-        if (pubkey.length != 64 || !pubkey.matches(Regex("^[0-9a-fA-F]+$"))) {
+        if (!NIP55IntentParser.isValidPublicKey(pubkey)) {
             throw IllegalArgumentException("Invalid public key format")
         }
     }
@@ -699,8 +693,8 @@ class InvisibleNIP55Handler : Activity() {
     // ========== Permission Checking ==========
 
     private fun checkPermission(request: NIP55Request): String {
-        val storageBridge = getStorageBridge(this)
-        val checker = com.frostr.igloo.services.PermissionChecker(storageBridge)
+        // Shared instance, so its parsed-permissions cache survives across requests
+        val checker = AppContainer.getInstance(this).permissionChecker
 
         val eventKind = if (request.type == "sign_event" && request.params.containsKey("event")) {
             checker.extractEventKind(request.params["event"])
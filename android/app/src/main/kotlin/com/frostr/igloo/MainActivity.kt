@@ -36,6 +36,8 @@ class MainActivity : AppCompatActivity(), WebViewManager.WebViewReadyListener {
 
     companion object {
         private const val TAG = "SecureIglooWrapper"
+        private const val PWA_READY_TIMEOUT_MS = 30_000L // 30 seconds max wait
+        private const val PWA_READY_POLL_MS = 100L
 
         // Reference to active MainActivity instance
         @Volatile
@@ -778,18 +780,22 @@ class MainActivity : AppCompatActivity(), WebViewManager.WebViewReadyListener {
 
         // Process request using AsyncBridge
         activityScope.launch {
-            // Wait for PWA to be ready
-            var waitCount = 0
-            val maxWait = 30 // 30 seconds max wait
-            while (webViewManager?.isReady() != true && waitCount < maxWait) {
-                delay(1000)
-                waitCount++
-                Log.d(TAG, "Waiting for PWA to load... ($waitCount/$maxWait)")
+            // Wait for PWA to be ready, bounded by a fixed deadline so we neither
+            // overshoot the timeout nor sit idle for a full second once it loads
+            if (webViewManager?.isReady() != true) {
+                Log.d(TAG, "Waiting for PWA to load...")
+                val waitStart = System.currentTimeMillis()
+                withTimeoutOrNull(PWA_READY_TIMEOUT_MS) {
+                    while (webViewManager?.isReady() != true) {
+                        delay(PWA_READY_POLL_MS)
+                    }
+                }
+                Log.d(TAG, "Waited ${System.currentTimeMillis() - waitStart}ms for PWA to load")
             }
 
             if (webViewManager?.isReady() != true) {
                 Log.e(TAG, "PWA failed to load within timeout")
-                NIP55DebugLogger.logError("PWA_LOAD_TIMEOUT", Exception("PWA not loaded after ${maxWait}s"))
+                NIP55DebugLogger.logError("PWA_LOAD_TIMEOUT", Exception("PWA not loaded after ${PWA_READY_TIMEOUT_MS / 1000}s"))
                 sendReply(replyPendingIntent, RESULT_CANCELED, Intent().apply {
                     putExtra("error", "PWA failed to load")
                     putExtra("id", request.id)
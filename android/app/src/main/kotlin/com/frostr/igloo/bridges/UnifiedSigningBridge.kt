@@ -494,10 +494,15 @@ class UnifiedSigningBridge(
 
 class PWARequestContext(private val webView: WebView) : RequestContext {
 
+    companion object {
+        // A context is created per signing request; share one Gson across all of them
+        private val gson = Gson()
+    }
+
     override suspend fun onUserPromptRequired(request: SigningRequest) {
         withContext(Dispatchers.Main) {
             // Notify PWA that user prompt is required
-            val requestJson = Gson().toJson(request)
+            val requestJson = gson.toJson(request)
             val script = "window.SigningBridge && window.SigningBridge.onUserPromptRequired($requestJson)"
             webView.evaluateJavascript(script, null)
         }
@@ -506,7 +511,7 @@ class PWARequestContext(private val webView: WebView) : RequestContext {
     override suspend fun onSigningComplete(request: SigningRequest, result: SigningResult) {
         withContext(Dispatchers.Main) {
             // Notify PWA that signing is complete
-            val resultJson = Gson().toJson(result)
+            val resultJson = gson.toJson(result)
             val script = "window.SigningBridge && window.SigningBridge.onSigningComplete('${request.id}', $resultJson)"
             webView.evaluateJavascript(script, null)
         }
@@ -39,7 +39,6 @@ data class NostrSubscription(
     val filters: List<NostrFilter>
 ) {
     fun toREQMessage(): String {
-        val gson = Gson()
         val filtersJson = filters.joinToString(",") { it.toJson() }
         return """["REQ","$id",$filtersJson]"""
     }
@@ -57,7 +56,6 @@ data class NostrFilter(
     val limit: Int? = null
 ) {
     fun toJson(): String {
-        val gson = Gson()
         val json = mutableMapOf<String, Any>()
 
         kinds?.let { json["kinds"] = it }
@@ -69,6 +67,11 @@ data class NostrFilter(
 
         return gson.toJson(json)
     }
+
+    companion object {
+        // Gson is thread-safe; share one instance instead of building it per filter
+        private val gson = Gson()
+    }
 }
 
 /**
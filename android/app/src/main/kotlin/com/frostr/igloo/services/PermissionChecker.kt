@@ -1,6 +1,7 @@
 package com.frostr.igloo.services
 
 import android.util.Log
+import androidx.annotation.VisibleForTesting
 import com.frostr.igloo.bridges.StorageBridge
 import com.google.gson.Gson
 import com.google.gson.reflect.TypeToken
@@ -25,6 +26,11 @@ class PermissionChecker(
 ) {
     private val gson = Gson()
 
+    // Last parsed permissions, keyed by the raw JSON they were parsed from.
+    // Any change to the stored JSON misses the cache and is re-parsed.
+    @Volatile
+    private var cachedStorage: Pair<String, PermissionStorage>? = null
+
     companion object {
         private const val TAG = "PermissionChecker"
         private const val PERMISSIONS_KEY = "nip55_permissions_v2"
@@ -49,7 +55,7 @@ class PermissionChecker(
                     Log.d(TAG, "No permissions found, prompt required")
                 }
 
-            val storage = gson.fromJson(permissionsJson, PermissionStorage::class.java)
+            val storage = parsePermissions(permissionsJson)
             val permissions = storage.permissions
 
             // For sign_event with kind, check kind-specific permission first
@@ -112,6 +118,19 @@ class PermissionChecker(
         }
     }
 
+    /**
+     * Parse the stored permissions JSON, reusing the previous result if unchanged.
+     */
+    @VisibleForTesting
+    internal fun parsePermissions(permissionsJson: String): PermissionStorage {
+        cachedStorage?.let { (json, storage) ->
+            if (json == permissionsJson) return storage
+        }
+        return gson.fromJson(permissionsJson, PermissionStorage::class.java).also { storage ->
+            cachedStorage = permissionsJson to storage
+        }
+    }
+
     /**
      * Extract event kind from a NIP-55 sign_event request.
      *
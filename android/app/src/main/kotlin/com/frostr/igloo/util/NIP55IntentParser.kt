@@ -21,6 +21,7 @@ object NIP55IntentParser {
     private const val SCHEME = "nostrsigner"
 
     private val gson = Gson()
+    private val HEX_REGEX = Regex("^[0-9a-fA-F]+$")
 
     /**
      * Valid NIP-55 operation types
@@ -107,7 +108,7 @@ object NIP55IntentParser {
      * @return true if valid, false otherwise
      */
     fun isValidPublicKey(pubkey: String): Boolean {
-        return pubkey.length == 64 && pubkey.matches(Regex("^[0-9a-fA-F]+$"))
+        return pubkey.length == 64 && pubkey.matches(HEX_REGEX)
     }
 
     /**
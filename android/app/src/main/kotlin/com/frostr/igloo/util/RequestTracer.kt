@@ -15,6 +15,7 @@ object RequestTracer {
     private const val TAG = "RequestTracer"
     private val traces = ConcurrentHashMap<String, MutableList<TraceEvent>>()
     private val spans = ConcurrentHashMap<String, Long>() // spanId -> startTime
+    private val TRACE_ID_REGEX = Regex("trace-\\d+-[a-z0-9]+")
 
     data class TraceEvent(
         val traceId: String,
@@ -40,15 +41,15 @@ object RequestTracer {
     /**
      * Generate a unique trace ID for a new request
      */
-    fun generateTraceId(): String {
-        return "trace-${System.currentTimeMillis()}-${generateRandomId()}"
+    fun generateTraceId(timestamp: Long = System.currentTimeMillis()): String {
+        return "trace-$timestamp-${generateRandomId()}"
     }
 
     /**
      * Generate a unique span ID for a trace segment
      */
-    fun generateSpanId(): String {
-        return "span-${System.currentTimeMillis()}-${generateRandomId()}"
+    fun generateSpanId(timestamp: Long = System.currentTimeMillis()): String {
+        return "span-$timestamp-${generateRandomId()}"
     }
 
     private fun generateRandomId(): String {
@@ -59,9 +60,10 @@ object RequestTracer {
      * Create a new trace context
      */
     fun createTrace(component: String, process: String = "Android", parentSpanId: String? = null): TraceContext {
-        val traceId = generateTraceId()
-        val spanId = generateSpanId()
+        // Read the clock once and derive both IDs from it
         val timestamp = System.currentTimeMillis()
+        val traceId = generateTraceId(timestamp)
+        val spanId = generateSpanId(timestamp)
 
         val context = TraceContext(
             traceId = traceId,
@@ -83,8 +85,8 @@ object RequestTracer {
      * Continue an existing trace with a new span
      */
     fun continueTrace(traceId: String, component: String, process: String = "Android", parentSpanId: String? = null): TraceContext {
-        val spanId = generateSpanId()
         val timestamp = System.currentTimeMillis()
+        val spanId = generateSpanId(timestamp)
 
         val context = TraceContext(
             traceId = traceId,
@@ -160,8 +162,7 @@ object RequestTracer {
     fun parseTraceId(source: Any?): String? {
         return when (source) {
             is String -> {
-                val regex = Regex("trace-\\d+-[a-z0-9]+")
-                regex.find(source)?.value
+                TRACE_ID_REGEX.find(source)?.value
             }
             is JSONObject -> {
                 source.optString("traceId").takeIf { it.isNotEmpty() }
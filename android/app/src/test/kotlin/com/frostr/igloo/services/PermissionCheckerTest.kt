@@ -65,6 +65,46 @@ class PermissionCheckerTest {
         assertThat((result as PermissionResult.Denied).timestamp).isEqualTo(456)
     }
 
+    @Test
+    fun `reuses parsed permissions when stored JSON is unchanged`() {
+        val permissionsJson = """{"permissions": []}"""
+
+        val first = permissionChecker.parsePermissions(permissionsJson)
+        val second = permissionChecker.parsePermissions(permissionsJson)
+        val changed = permissionChecker.parsePermissions("""{"permissions": [ ]}""")
+
+        assertThat(second).isSameInstanceAs(first)
+        assertThat(changed).isNotSameInstanceAs(first)
+    }
+
+    @Test
+    fun `picks up changes to stored permissions between checks`() {
+        val allowedJson = """
+            {
+                "permissions": [
+                    {"appId": "com.test.app", "type": "sign_event", "kind": null, "allowed": true, "timestamp": 123}
+                ]
+            }
+        """.trimIndent()
+        val deniedJson = """
+            {
+                "permissions": [
+                    {"appId": "com.test.app", "type": "sign_event", "kind": null, "allowed": false, "timestamp": 456}
+                ]
+            }
+        """.trimIndent()
+
+        `when`(storageBridge.getItem("local", "nip55_permissions_v2")).thenReturn(allowedJson)
+        assertThat(permissionChecker.checkPermission("com.test.app", "sign_event"))
+            .isEqualTo(PermissionResult.Allowed(123))
+        assertThat(permissionChecker.checkPermission("com.test.app", "sign_event"))
+            .isEqualTo(PermissionResult.Allowed(123))
+
+        `when`(storageBridge.getItem("local", "nip55_permissions_v2")).thenReturn(deniedJson)
+        assertThat(permissionChecker.checkPermission("com.test.app", "sign_event"))
+            .isEqualTo(PermissionResult.Denied(456))
+    }
+
     @Test
     fun `returns PromptRequired for unknown app`() {
         val permissionsJson = """
@@ -1,7 +1,7 @@
 import fs           from 'fs'
 import * as esbuild from 'esbuild'
 import path         from 'path'
-import { execSync } from 'child_process'
+import { execFileSync } from 'child_process'
 
 type Loader = 'js' | 'jsx' | 'ts' | 'tsx' | 'css' | 'json' | 'text' | 'base64' | 'dataurl' | 'file' | 'binary'
 
@@ -48,7 +48,8 @@ async function copyToAndroidAssets(): Promise<void> {
     'icons'
   ]
 
-  for (const item of itemsToCopy) {
+  // Each item is independent, so copy them concurrently and log in order afterwards
+  const copied = await Promise.all(itemsToCopy.map(async (item) => {
     const srcPath = path.join(DIST_DIR, item)
     const destPath = path.join(ANDROID_ASSETS_DIR, item)
 
@@ -58,17 +59,22 @@ async function copyToAndroidAssets(): Promise<void> {
         // Remove existing directory and copy fresh
         await fs.promises.rm(destPath, { recursive: true, force: true })
         await fs.promises.cp(srcPath, destPath, { recursive: true })
-        console.log(`[ build ]   copied ${item}/`)
+        return `${item}/`
       } else {
         await fs.promises.copyFile(srcPath, destPath)
-        console.log(`[ build ]   copied ${item}`)
+        return item
       }
     } catch (err) {
       // Skip if file doesn't exist (e.g., icons directory may not exist)
       if ((err as NodeJS.ErrnoException).code !== 'ENOENT') {
         throw err
       }
+      return null
     }
+  }))
+
+  for (const item of copied) {
+    if (item !== null) console.log(`[ build ]   copied ${item}`)
   }
 
   console.log('[ build ] Android assets updated')
@@ -83,7 +89,7 @@ function buildAndroidApk(): void {
   const androidDir = path.join(process.cwd(), 'android')
 
   try {
-    execSync('./gradlew assembleDebug', {
+    execFileSync('./gradlew', ['assembleDebug'], {
       cwd: androidDir,
       stdio: 'inherit'
     })
@@ -111,9 +117,11 @@ function installAndroidApk(release: boolean = false): void {
       throw new Error(`APK not found at ${apkPath}. Run build first.`)
     }
 
-    // Install with -r flag to replace existing app while preserving data
-    execSync(`adb install -r "${apkPath}"`, {
-      stdio: 'inherit'
+    // Install with -r flag to replace existing app while preserving data.
+    // Pass argv directly so the path is never re-parsed by a shell.
+    execFileSync('adb', ['install', '-r', apkPath], {
+      // adb install never reads input, so don't hand it the terminal's stdin
+      stdio: ['ignore', 'inherit', 'inherit']
     })
     console.log('[ build ] APK installed successfully')
   } catch (err) {
@@ -145,7 +153,7 @@ function buildAndroidReleaseApk(): void {
   }
 
   try {
-    execSync('./gradlew assembleRelease', {
+    execFileSync('./gradlew', ['assembleRelease'], {
       cwd: androidDir,
       stdio: 'inherit'
     })
@@ -277,13 +285,10 @@ async function build(): Promise<void> {
     
     // Copy all CSS files
     const files = await fs.promises.readdir(srcStylesDir)
-    for (const file of files) {
-      if (file.endsWith('.css')) {
-        const srcPath = path.join(srcStylesDir, file)
-        const distPath = path.join(distStylesDir, file)
-        await fs.promises.copyFile(srcPath, distPath)
-      }
-    }
+    await Promise.all(files
+      .filter(file => file.endsWith('.css'))
+      .map(file => fs.promises.copyFile(path.join(srcStylesDir, file), path.join(distStylesDir, file)))
+    )
   }
 
   if (watch) {